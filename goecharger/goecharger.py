@@ -6,6 +6,11 @@ import requests
 from enum import Enum
 from json.decoder import JSONDecodeError
 
+CURRENT_MIN = 6
+CURRENT_MAX = 32
+LED_BRIGHTNESS_MIN = 0
+LED_BRIGHTNESS_MAX = 255
+
 
 class GoeChargerStatusMapper:
 
@@ -25,6 +30,8 @@ class GoeChargerStatusMapper:
         stop_mode = GoeCharger.GO_STOP_MODE.get(status.get('stp')) or 'unknown'
         cable_max_current = int(status.get('cbl', 0))
         cable_lock_mode = int(status.get('ust', 0))
+        tma = status.get('tma', [])
+        nrg = status.get('nrg', [])
 
         def valueOrNull(array, index):
             try:
@@ -45,11 +52,11 @@ class GoeChargerStatusMapper:
             pre_contactor_l1 = pre_contactor_l2 = pre_contactor_l3 = 'unknown'
             post_contactor_l1 = post_contactor_l2 = post_contactor_l3 = 'unknown'
 
-        if len(status.get('tma', [])) > 0:
-            t0 = float(valueOrNull(status.get('tma', []), GoeCharger.TMA_0))
-            t1 = float(valueOrNull(status.get('tma', []), GoeCharger.TMA_1))
-            t2 = float(valueOrNull(status.get('tma', []), GoeCharger.TMA_2))
-            t3 = float(valueOrNull(status.get('tma', []), GoeCharger.TMA_3))
+        if len(tma) > 0:
+            t0 = float(valueOrNull(tma, GoeCharger.TMA_0))
+            t1 = float(valueOrNull(tma, GoeCharger.TMA_1))
+            t2 = float(valueOrNull(tma, GoeCharger.TMA_2))
+            t3 = float(valueOrNull(tma, GoeCharger.TMA_3))
             charger_temp = round(int((t0 + t1 + t2 + t3) / 4), 2)
         else:
             charger_temp = int(status.get('tmp', 0))  # Deprecated: Just for chargers with old firmware
@@ -97,10 +104,10 @@ class GoeChargerStatusMapper:
             'post_contactor_l2': post_contactor_l2,
             'post_contactor_l3': post_contactor_l3,
             'charger_temp': charger_temp,  # Deprecated: Just for chargers with old firmware
-            'charger_temp0': round(float(valueOrNull(status.get('tma', []), GoeCharger.TMA_0)), 2),
-            'charger_temp1': round(float(valueOrNull(status.get('tma', []), GoeCharger.TMA_1)), 2),
-            'charger_temp2': round(float(valueOrNull(status.get('tma', []), GoeCharger.TMA_2)), 2),
-            'charger_temp3': round(float(valueOrNull(status.get('tma', []), GoeCharger.TMA_3)), 2),
+            'charger_temp0': round(float(valueOrNull(tma, GoeCharger.TMA_0)), 2),
+            'charger_temp1': round(float(valueOrNull(tma, GoeCharger.TMA_1)), 2),
+            'charger_temp2': round(float(valueOrNull(tma, GoeCharger.TMA_2)), 2),
+            'charger_temp3': round(float(valueOrNull(tma, GoeCharger.TMA_3)), 2),
             'current_session_charged_energy': round(current_session_charged_energy, 5),
             'charge_limit': charge_limit,
             'adapter': adapter,
@@ -109,22 +116,22 @@ class GoeChargerStatusMapper:
             'energy_by_token': energy_by_token,
             'wifi': wifi,
 
-            'u_l1': int(valueOrNull(status.get('nrg', []), GoeCharger.U_L1)),
-            'u_l2': int(valueOrNull(status.get('nrg', []), GoeCharger.U_L2)),
-            'u_l3': int(valueOrNull(status.get('nrg', []), GoeCharger.U_L3)),
-            'u_n': int(valueOrNull(status.get('nrg', []), GoeCharger.U_N)),
-            'i_l1': int(valueOrNull(status.get('nrg', []), GoeCharger.I_L1)) / 10.0,
-            'i_l2': int(valueOrNull(status.get('nrg', []), GoeCharger.I_L2)) / 10.0,
-            'i_l3': int(valueOrNull(status.get('nrg', []), GoeCharger.I_L3)) / 10.0,
-            'p_l1': int(valueOrNull(status.get('nrg', []), GoeCharger.P_L1)) / 10.0,
-            'p_l2': int(valueOrNull(status.get('nrg', []), GoeCharger.P_L2)) / 10.0,
-            'p_l3': int(valueOrNull(status.get('nrg', []), GoeCharger.P_L3)) / 10.0,
-            'p_n': int(valueOrNull(status.get('nrg', []), GoeCharger.P_N)) / 10.0,
-            'p_all': int(valueOrNull(status.get('nrg', []), GoeCharger.P_ALL)) / 100.0,
-            'lf_l1': int(valueOrNull(status.get('nrg', []), GoeCharger.LF_L1)),
-            'lf_l2': int(valueOrNull(status.get('nrg', []), GoeCharger.LF_L2)),
-            'lf_l3': int(valueOrNull(status.get('nrg', []), GoeCharger.LF_L3)),
-            'lf_n': int(valueOrNull(status.get('nrg', []), GoeCharger.LF_N)),
+            'u_l1': int(valueOrNull(nrg, GoeCharger.U_L1)),
+            'u_l2': int(valueOrNull(nrg, GoeCharger.U_L2)),
+            'u_l3': int(valueOrNull(nrg, GoeCharger.U_L3)),
+            'u_n': int(valueOrNull(nrg, GoeCharger.U_N)),
+            'i_l1': int(valueOrNull(nrg, GoeCharger.I_L1)) / 10.0,
+            'i_l2': int(valueOrNull(nrg, GoeCharger.I_L2)) / 10.0,
+            'i_l3': int(valueOrNull(nrg, GoeCharger.I_L3)) / 10.0,
+            'p_l1': int(valueOrNull(nrg, GoeCharger.P_L1)) / 10.0,
+            'p_l2': int(valueOrNull(nrg, GoeCharger.P_L2)) / 10.0,
+            'p_l3': int(valueOrNull(nrg, GoeCharger.P_L3)) / 10.0,
+            'p_n': int(valueOrNull(nrg, GoeCharger.P_N)) / 10.0,
+            'p_all': int(valueOrNull(nrg, GoeCharger.P_ALL)) / 100.0,
+            'lf_l1': int(valueOrNull(nrg, GoeCharger.LF_L1)),
+            'lf_l2': int(valueOrNull(nrg, GoeCharger.LF_L2)),
+            'lf_l3': int(valueOrNull(nrg, GoeCharger.LF_L3)),
+            'lf_n': int(valueOrNull(nrg, GoeCharger.LF_N)),
 
             'firmware': firmware,
             'serial_number': serial_number,
@@ -139,10 +146,14 @@ class GoeChargerStatusMapper:
 class GoeCharger:
     host = ''
 
-    def __init__(self, host):
+    def __init__(self, host, timeout=5):
         if (host is None or host == ''):
             raise ValueError("host must be specified")
         self.host = host
+        self.__statusUrl = "http://%s/status" % host
+        self.__mqttUrl = "http://%s/mqtt?payload=" % host
+        self.__session = requests.Session()
+        self.__timeout = timeout
 
     GO_CAR_STATUS = {
         '1': 'Charger ready, no vehicle',
@@ -213,14 +224,14 @@ class GoeCharger:
 
     def __queryStatusApi(self):
         try:
-            statusRequest = requests.get("http://%s/status" % self.host, timeout=5)  # TODO: Configurable Timeout
+            statusRequest = self.__session.get(self.__statusUrl, timeout=self.__timeout)
             status = statusRequest.json()
             return status
         except (requests.exceptions.ConnectTimeout, requests.exceptions.ConnectionError):
             return {}
 
     def __setParameter(self, parameter, value):
-        setRequest = requests.get("http://%s/mqtt?payload=%s=%s" % (self.host, parameter, value))
+        setRequest = self.__session.get("%s%s=%s" % (self.__mqttUrl, parameter, value), timeout=self.__timeout)
         return GoeChargerStatusMapper().mapApiStatusResponse(setRequest.json())
 
     def setAccessType(self, accessType):
@@ -269,10 +280,7 @@ class GoeCharger:
         return self.__setParameter('cfi', str(color))
 
     def setLedBrightness(self, brightness):
-        if brightness < 0:
-            brightness = 0
-        if brightness > 255:
-            brightness = 255
+        brightness = min(max(brightness, LED_BRIGHTNESS_MIN), LED_BRIGHTNESS_MAX)
         return self.__setParameter('lbr', str(brightness))
 
     def setLedAutoTurnOff(self, autoTurnOff):
@@ -282,24 +290,15 @@ class GoeCharger:
             return self.__setParameter('r2x', '0')
 
     def setAbsoluteMaxCurrent(self, maxCurrent):
-        if maxCurrent < 6:
-            maxCurrent = 6
-        if maxCurrent > 32:
-            maxCurrent = 32
+        maxCurrent = min(max(maxCurrent, CURRENT_MIN), CURRENT_MAX)
         return self.__setParameter('ama', str(maxCurrent))
 
     def setMaxCurrent(self, current):
-        if current < 6:
-            current = 6
-        if current > 32:
-            current = 32
+        current = min(max(current, CURRENT_MIN), CURRENT_MAX)
         return self.__setParameter('amp', str(current))
 
     def setTmpMaxCurrent(self, current):
-        if current < 6:
-            current = 6
-        if current > 32:
-            current = 32
+        current = min(max(current, CURRENT_MIN), CURRENT_MAX)
         return self.__setParameter('amx', str(current))
 
     def setChargeLimit(self, chargeLimit):
@@ -309,10 +308,7 @@ class GoeCharger:
     def setButtonCurrentValue(self, step, current):
         if step < 1 or step > 5:
             raise ValueError('Invalid Button step %d requested!' % step)
-        if current < 6:
-            current = 0
-        if current > 32:
-            current = 32
+        current = 0 if current < CURRENT_MIN else min(current, CURRENT_MAX)
         return self.__setParameter('al%d' % step, str(current))
 
     def requestStatus(self):
@@ -323,3 +319,12 @@ class GoeCharger:
         except JSONDecodeError:
             response = GoeChargerStatusMapper().mapApiStatusResponse({})
         return response
+
+    def close(self):
+        self.__session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
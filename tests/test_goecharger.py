@@ -39,174 +39,209 @@ class TestGoeCharger(TestCase):
     def test_create_with_host(self):
         self.assertIsNotNone(GoeCharger('127.0.0.1'))
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_requestStatus(self, mock_get):
         status = GoeCharger('127.0.0.1').requestStatus()
         self.assertEqual(SAMPLE_REQUEST_STATUS_RESPONSE, status)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
+    def test_requestStatusCustomTimeout(self, mock_get):
+        GoeCharger('127.0.0.1', timeout=2).requestStatus()
+        mock_get.assert_called_once_with('http://127.0.0.1/status', timeout=2)
+
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
+    def test_setParameterCustomTimeout(self, mock_get):
+        GoeCharger('127.0.0.1', timeout=2).setTmpMaxCurrent(10)
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amx=10', timeout=2)
+
+    @mock.patch('requests.Session')
+    def test_sessionReused(self, mock_session):
+        mock_session.return_value.get.side_effect = mocked_requests_get
+        charger = GoeCharger('127.0.0.1')
+        charger.requestStatus()
+        charger.setTmpMaxCurrent(10)
+        mock_session.assert_called_once_with()
+        mock_session.return_value.get.assert_has_calls([
+            mock.call('http://127.0.0.1/status', timeout=5),
+            mock.call('http://127.0.0.1/mqtt?payload=amx=10', timeout=5)
+        ])
+        self.assertEqual(2, mock_session.return_value.get.call_count)
+
+    @mock.patch('requests.Session')
+    def test_close(self, mock_session):
+        GoeCharger('127.0.0.1').close()
+        mock_session.return_value.close.assert_called_once_with()
+
+    @mock.patch('requests.Session')
+    def test_contextManagerCloses(self, mock_session):
+        with GoeCharger('127.0.0.1') as charger:
+            self.assertIsNotNone(charger)
+            mock_session.return_value.close.assert_not_called()
+        mock_session.return_value.close.assert_called_once_with()
+
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setAccessType(self, mock_get):
         response = GoeCharger('127.0.0.1').setAccessType(GoeCharger.AccessType.FREE)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=ast=0')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=ast=0', timeout=5)
         self.assertIsNotNone(response)
 
     def test_setAccessTypeInvalidValue(self):
         self.assertRaises(ValueError, helper_setAccessType_ValueError)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setCableLockMode(self, mock_get):
         response = GoeCharger('127.0.0.1').setCableLockMode(GoeCharger.CableLockMode.AUTOMATIC)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=ust=1')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=ust=1', timeout=5)
         self.assertIsNotNone(response)
 
     def test_setCableLockModeInvalidValue(self):
         self.assertRaises(ValueError, helper_setCableLockMode_ValueError)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setButtonCurrentValue(self, mock_get):
         response = GoeCharger('127.0.0.1').setButtonCurrentValue(1,6)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=al1=6')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=al1=6', timeout=5)
         self.assertIsNotNone(response)
 
     def test_setButtonCurrentValueInvalidButton(self):
         self.assertRaises(ValueError, helper_setButtonCurrentValue_ValueError)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setButtonCurrentValueToLow(self, mock_get):
         response = GoeCharger('127.0.0.1').setButtonCurrentValue(1,5)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=al1=0')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=al1=0', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setButtonCurrentValueToHigh(self, mock_get):
         response = GoeCharger('127.0.0.1').setButtonCurrentValue(1,33)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=al1=32')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=al1=32', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setChargeLimit(self, mock_get):
         response = GoeCharger('127.0.0.1').setChargeLimit(2.4)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=dwo=24')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=dwo=24', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setTmpMaxCurrent(self, mock_get):
         response = GoeCharger('127.0.0.1').setTmpMaxCurrent(10)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amx=10')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amx=10', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setTmpMaxCurrentToLow(self, mock_get):
         response = GoeCharger('127.0.0.1').setTmpMaxCurrent(5)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amx=6')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amx=6', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setTmpMaxCurrentToHigh(self, mock_get):
         response = GoeCharger('127.0.0.1').setTmpMaxCurrent(33)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amx=32')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amx=32', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setMaxCurrent(self, mock_get):
         response = GoeCharger('127.0.0.1').setMaxCurrent(10)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amp=10')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amp=10', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setMaxCurrentToLow(self, mock_get):
         response = GoeCharger('127.0.0.1').setMaxCurrent(5)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amp=6')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amp=6', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setMaxCurrentToHigh(self, mock_get):
         response = GoeCharger('127.0.0.1').setMaxCurrent(33)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amp=32')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=amp=32', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setAbsoluteMaxCurrentToLow(self, mock_get):
         response = GoeCharger('127.0.0.1').setAbsoluteMaxCurrent(5)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=ama=6')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=ama=6', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setAbsoluteMaxCurrentToHigh(self, mock_get):
         response = GoeCharger('127.0.0.1').setAbsoluteMaxCurrent(33)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=ama=32')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=ama=32', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setLedAutoTurnOffTrue(self, mock_get):
         response = GoeCharger('127.0.0.1').setLedAutoTurnOff(True)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=r2x=1')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=r2x=1', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setLedAutoTurnOffFalse(self, mock_get):
         response = GoeCharger('127.0.0.1').setLedAutoTurnOff(False)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=r2x=0')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=r2x=0', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setAllowChargingTrue(self, mock_get):
         response = GoeCharger('127.0.0.1').setAllowCharging(True)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=alw=1')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=alw=1', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setAllowChargingFalse(self, mock_get):
         response = GoeCharger('127.0.0.1').setAllowCharging(False)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=alw=0')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=alw=0', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setAutoStopTrue(self, mock_get):
         response = GoeCharger('127.0.0.1').setAutoStop(True)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=stp=2')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=stp=2', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setAutoStopFalse(self, mock_get):
         response = GoeCharger('127.0.0.1').setAutoStop(False)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=stp=0')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=stp=0', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setStandbyColor(self, mock_get):
         response = GoeCharger('127.0.0.1').setStandbyColor(0x808080)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=cid=8421504')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=cid=8421504', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setChargingActiveColor(self, mock_get):
         response = GoeCharger('127.0.0.1').setChargingActiveColor(0x808080)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=cch=8421504')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=cch=8421504', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setChargingFinishedColor(self, mock_get):
         response = GoeCharger('127.0.0.1').setChargingFinishedColor(0x808080)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=cfi=8421504')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=cfi=8421504', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setLedBrightness(self, mock_get):
         response = GoeCharger('127.0.0.1').setLedBrightness(100)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=lbr=100')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=lbr=100', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setLedBrightnessToLow(self, mock_get):
         response = GoeCharger('127.0.0.1').setLedBrightness(-1)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=lbr=0')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=lbr=0', timeout=5)
         self.assertIsNotNone(response)
 
-    @mock.patch('requests.get', side_effect=mocked_requests_get)
+    @mock.patch('requests.Session.get', side_effect=mocked_requests_get)
     def test_setLedBrightnessToHigh(self, mock_get):
         response = GoeCharger('127.0.0.1').setLedBrightness(256)
-        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=lbr=255')
+        mock_get.assert_called_once_with('http://127.0.0.1/mqtt?payload=lbr=255', timeout=5)
         self.assertIsNotNone(response)
 
     def test_chargerNotAvailable(self):